@@ -35,6 +35,12 @@ GUI_BG_COLOR = '#36393F'  # background color (copied from discord colors)
 AUTO_PASTE = True  # automatically paste the image after selection
 AUTO_ENTER = True  # hit enter after pasting (useful in Discord)
 
+""" Quick Paste """
+QUICK_PASTE = True  # paste top emotes with hotkeys, without opening the picker
+QUICK_PASTE_MODIFIER = 'alt+shift'  # slot n is triggered by MODIFIER+n (avoid ctrl+alt, it's AltGr on Windows)
+NUM_QUICK_PASTE = 9  # number of quick paste slots (max 9, keys 1-9)
+QUICK_PASTE_PINNED = []  # filenames pinned to the first slots, rest use frequents
+
 """ Image Resizer """
 RESIZE_GIFS = False  # requires `gifsicle`
 
@@ -49,6 +55,9 @@ CUSTOM_HOTKEY_HANDLER = True  # workaround for alt+tab issues and broken scan co
 
 
 SYSTEM = platform.system()  # Windows, Linux, Darwin (Mac OS)
+NUM_QUICK_PASTE = min(NUM_QUICK_PASTE, 9)  # only keys 1-9 have slots
+QUICK_PASTE_EVENT = '-QUICK_PASTE-'  # event sent from hotkey thread to the GUI event loop
+REBUILD_EVENT = '-REBUILD-'  # rebuild stale layout on the GUI thread, then show it
 
 
 class PingMote():
@@ -65,6 +74,7 @@ class PingMote():
         # Setup
         self.window = None
         self.hidden = True
+        self.layout_stale = False  # frequents changed by quick paste, rebuild on next select
         self.window_location = WINDOW_LOCATION
         self.setup_hardware()
         if CUSTOM_HOTKEY_HANDLER:
@@ -87,8 +97,8 @@ class PingMote():
         self.system_tray = SystemTray(menu=['_', ['Show', 'Hide', 'Edit Me', 'Settings', 'Exit']], icon=ICON, window=self.window, single_click_events=True)
         self.system_tray.show_message('Ready', 'Window created and hidden')
 
-    def layout_gui(self):
-        """ Layout GUI, then build a window and hide it """
+    def layout_gui(self, show=False):
+        """ Layout GUI, then build a window and hide it (or show it if show is True) """
         print('loading layout...')
         self.layout = []
         if SHOW_FREQUENTS:
@@ -106,7 +116,11 @@ class PingMote():
         if SYSTEM == 'Darwin':  # Mac hacky fix for blank hidden windows
             # read the window once, allows for hiding
             self.window.read(timeout=10)
-        self.hide_gui()
+        self.layout_stale = False
+        if show:  # skip hide_gui, avoids command+tab on Mac
+            self.show_gui()
+        else:
+            self.hide_gui()
 
     def layout_frequents_section(self):
         """ Return a list of frequent emotes """
@@ -151,6 +165,13 @@ class PingMote():
         try:
             while True:
                 event, values = self.window.read()
+                # handle hotkey events first, without a tray notification
+                if event == QUICK_PASTE_EVENT:
+                    self.on_quick_paste(values[event])
+                    continue
+                if event == REBUILD_EVENT:
+                    self.layout_gui(show=True)
+                    continue
                 self.system_tray.show_message(event, values)
 
                 if event == self.system_tray.key:
@@ -186,19 +207,37 @@ class PingMote():
             print('Error: Link missing -', event)
             return
 
+        self.window_location = self.window.current_location()  # remember window position
+        self.insert_emote(event)
+
+    def queue_quick_paste(self, slot):
+        """ Hand a quick paste hotkey over to the GUI event loop (hotkeys run on another thread) """
+        self.window.write_event_value(QUICK_PASTE_EVENT, slot)
+
+    def on_quick_paste(self, slot):
+        """ Paste the emote in the given quick paste slot without showing the GUI """
+        slots = self.get_quick_paste_slots()
+        if slot >= len(slots):  # slot not filled yet
+            return
+        # release held modifiers so they don't mix with paste/enter (not restored,
+        # the user may let go of them while we paste, leaving them stuck)
+        keyboard.release(QUICK_PASTE_MODIFIER)
+        self.insert_emote(slots[slot], rebuild=False)  # rebuilding would show/hide the window
+
+    def insert_emote(self, filename, rebuild=True):
+        """ Copy/paste the image link, then update its count """
         if AUTO_PASTE:
             if PRESERVE_CLIPBOARD:  # write text with pynput
-                self.paste_selection(event)
+                self.paste_selection(filename)
             else:  # copy to clipboard then paste
-                self.copy_to_clipboard(event)
+                self.copy_to_clipboard(filename)
                 self.paste_link()
             if AUTO_ENTER:
                 self.keyboard_enter()
         else:
-            self.copy_to_clipboard(event)
+            self.copy_to_clipboard(filename)
 
-        self.window_location = self.window.current_location()  # remember window position
-        self.update_frequencies(event)  # update count for chosen image
+        self.update_frequencies(filename, rebuild)  # update count for chosen image
 
     def copy_to_clipboard(self, filename):
         """ Given an an image, copy the image link to clipboard """
@@ -219,9 +258,10 @@ class PingMote():
         sleep(SLEEP_TIME)
         keyboard.send('enter')
 
-    def update_frequencies(self, filename):
+    def update_frequencies(self, filename, rebuild=True):
         """ Increment chosen image's counter in frequencies.json
-            Rebuilds GUI if layout changes (frequents section changes)
+            Rebuilds GUI if layout changes (frequents section changes),
+            or marks it stale to rebuild later if rebuild is False
         """
         if filename not in self.frequencies:
             self.frequencies[filename] = 0
@@ -230,8 +270,11 @@ class PingMote():
         prev_frequents = self.frequents
         self.frequents = self.get_frequents(
             self.frequencies)  # update frequents list
-        if self.frequents != prev_frequents:  # frequents list has changed, update layout
-            self.layout_gui()
+        if self.frequents != prev_frequents or self.layout_stale:  # frequents list has changed, update layout
+            if rebuild:
+                self.layout_gui()
+            else:  # rebuilt the next time the GUI is opened
+                self.layout_stale = True
 
     def clean_frequencies(self):
         """ Clean frequencies.json on file changes """
@@ -267,12 +310,20 @@ class PingMote():
         with open(MAIN_PATH / 'assets' / 'frequencies.json', 'w') as f:
             json.dump(frequencies, f, indent=4)
 
-    def get_frequents(self, frequencies):
-        """ Get the images used most frequently """
+    def get_frequents(self, frequencies, limit=NUM_FREQUENT):
+        """ Get the images used most frequently (all of them if limit is None) """
         # sort in descending order by frequency
         desc_frequencies = sorted(
             frequencies.items(), key=lambda x: x[-1], reverse=True)
-        return [img for img, _ in desc_frequencies[:NUM_FREQUENT]]
+        return [img for img, _ in desc_frequencies[:limit]]
+
+    def get_quick_paste_slots(self):
+        """ Get the images for quick paste slots: pinned first, then frequents """
+        slots = [img for img in dict.fromkeys(QUICK_PASTE_PINNED)  # drop duplicates
+                 if img in self.filename_to_link]
+        slots += [img for img in self.get_frequents(self.frequencies, limit=None)
+                  if img in self.filename_to_link and img not in slots]
+        return slots[:NUM_QUICK_PASTE]
 
     def list_to_table(self, a, num_cols=NUM_COLS):
         """ Given a list a, convert it to rows and columns
@@ -291,6 +342,17 @@ class PingMote():
         else:
             keyboard.add_hotkey(SHORTCUT, self.on_activate)
             keyboard.add_hotkey(KILL_SHORTCUT, self.kill_all)
+        if QUICK_PASTE:
+            if CUSTOM_HOTKEY_HANDLER:
+                # match digits by scan code, shift changes their names (1 -> !)
+                self.quick_paste_keys = {
+                    slot: set(keyboard.key_to_scan_codes(str(slot + 1)))
+                    for slot in range(NUM_QUICK_PASTE)
+                }
+            else:
+                for slot in range(NUM_QUICK_PASTE):
+                    hotkey = f'{QUICK_PASTE_MODIFIER}+{slot + 1}'
+                    keyboard.add_hotkey(hotkey, self.queue_quick_paste, args=(slot,))
 
     def custom_hotkey(self, event):
         """ Hook and react to hotkeys with custom handler """
@@ -308,6 +370,12 @@ class PingMote():
             if pressed:
                 func()
 
+        if QUICK_PASTE and all(key in pressed_keys for key in QUICK_PASTE_MODIFIER.split('+')):
+            pressed_codes = set(keyboard._pressed_events)
+            for slot, scan_codes in self.quick_paste_keys.items():
+                if scan_codes & pressed_codes:
+                    self.queue_quick_paste(slot)
+
     def hide_gui(self):
         self.window.hide()
         self.hidden = True
@@ -321,7 +389,9 @@ class PingMote():
 
     def on_activate(self):
         """ When hotkey is activated, toggle the GUI """
-        if self.hidden:
+        if self.hidden and self.layout_stale:  # quick paste changed frequents
+            self.window.write_event_value(REBUILD_EVENT, None)
+        elif self.hidden:
             self.show_gui()
         else:
             self.hide_gui()